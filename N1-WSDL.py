@@ -1,22 +1,8 @@
 import xml.etree.ElementTree as ET
-import requests
 import sys
 import os
 import json
-
-def descargar_wsdl(url, archivo_destino):
-    """
-    Descarga el archivo WSDL desde una URL y lo guarda localmente.
-    """
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(archivo_destino, "wb") as file:
-            file.write(response.content)
-        return archivo_destino
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar el archivo WSDL: {e}")
-        sys.exit(1)
+from utilidades_wsdl import obtener_archivo
 
 def imprimir_wsdl(archivo):
     """
@@ -162,8 +148,8 @@ if __name__ == "__main__":
 
     temp_file = "temp.wsdl"
 
-    # Descargar el archivo WSDL
-    wsdl_path = descargar_wsdl(url, temp_file)
+    # Descargar el archivo WSDL (o descomprimirlo si es un .wsdl.gz local)
+    wsdl_path, es_temporal = obtener_archivo(url, temp_file)
 
     # Analizar el archivo WSDL
     service_name, datos_wsdl = analizar_wsdl(wsdl_path)
@@ -183,7 +169,8 @@ if __name__ == "__main__":
         print(json.dumps(datos_wsdl, indent=4, ensure_ascii=False))
 
     # Eliminar archivo temporal
-    os.remove(wsdl_path)
+    if es_temporal:
+        os.remove(wsdl_path)
 
     # Mostrar ruta absoluta del archivo JSON generado
     print(f"\nArchivo JSON generado: {output_path}")
@@ -1,23 +1,16 @@
 import xml.etree.ElementTree as ET
-import requests
 import sys
 import os
-import json
+import io
+from concurrent.futures import ThreadPoolExecutor
+from huellas_wsdl import calcular_huellas
+from campos_wsdl import construir_indice_campos
+from utilidades_wsdl import guardar_json, leer_bloques, nombre_salida_json, resolver_ubicacion
 
-def descargar_archivo(url, archivo_destino):
-    """ Descarga un archivo desde una URL y lo guarda localmente. """
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(archivo_destino, "wb") as file:
-            file.write(response.content)
-        return archivo_destino
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar el archivo: {e}")
-        sys.exit(1)
+XSD_REFERENCIAS = ("{http://www.w3.org/2001/XMLSchema}include", "{http://www.w3.org/2001/XMLSchema}import")
 
 def analizar_schema(schema_path):
-    """ Analiza el XSD y devuelve todos los complexType. """
+    """ Analiza el XSD y devuelve todos los complexType con la cardinalidad de sus elementos. """
     try:
         tree = ET.parse(schema_path)
         root = tree.getroot()
@@ -32,7 +25,9 @@ def analizar_schema(schema_path):
                 for element in sequence.findall("xs:element", ns):
                     elements.append({
                         "name": element.attrib.get("name"),
-                        "type": element.attrib.get("type")
+                        "type": element.attrib.get("type"),
+                        "minOccurs": element.attrib.get("minOccurs", "1"),
+                        "maxOccurs": element.attrib.get("maxOccurs", "1")
                     })
             complex_types[name] = elements
         return complex_types
@@ -40,71 +35,106 @@ def analizar_schema(schema_path):
         print(f"Error al analizar el esquema: {e}")
         sys.exit(1)
 
-def analizar_wsdl(file_path):
-    """ Analiza el WSDL y extrae detalles del servicio, mensajes y operaciones. """
+def descargar_y_analizar_schema(ubicacion):
+    """ Descarga un XSD en memoria y devuelve sus complexType. """
+    contenido = b"".join(leer_bloques(ubicacion))
+    return analizar_schema(io.BytesIO(contenido))
+
+def analizar_wsdl_en_flujo(origen, executor):
+    """
+    Analiza el WSDL a medida que se lee y lanza la descarga de cada esquema
+    (xsd:include / xsd:import) en cuanto aparece, sin esperar a terminar el WSDL.
+
+    Retorno:
+        tuple: (datos del WSDL, lista de futures con los complexType de cada esquema).
+    """
+    parser = ET.XMLPullParser(events=("start",))
+    root = None
+    ubicaciones = []
+    futuros = []
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        ns = {
-            "wsdl": "http://schemas.xmlsoap.org/wsdl/",
-            "soap": "http://schemas.xmlsoap.org/wsdl/soap/",
-            "xsd": "http://www.w3.org/2001/XMLSchema"
-        }
-
-        data = {
-            "service_name": root.attrib.get("name"),
-            "target_namespace": root.find(".//xsd:schema", ns).attrib.get("targetNamespace", ""),
-            "schema_location": root.find(".//xsd:schema/xsd:include", ns).attrib.get("schemaLocation", ""),
-            "messages": [],
-            "operations": [],
-            "services": [],
-            "binding": None
-        }
+        for bloque in leer_bloques(origen):
+            parser.feed(bloque)
+            for _, elemento in parser.read_events():
+                if root is None:
+                    root = elemento
+                if elemento.tag in XSD_REFERENCIAS and elemento.attrib.get("schemaLocation"):
+                    ubicacion = elemento.attrib["schemaLocation"]
+                    ubicaciones.append(ubicacion)
+                    futuros.append(executor.submit(descargar_y_analizar_schema, resolver_ubicacion(origen, ubicacion)))
+        parser.close()
+    except ET.ParseError as e:
+        print(f"Error al analizar el WSDL: {e}")
+        sys.exit(1)
 
-        # Extraer mensajes
-        for message in root.findall("wsdl:message", ns):
-            message_name = message.attrib.get("name")
-            parts = []
-            for part in message.findall("wsdl:part", ns):
-                parts.append({
-                    "name": part.attrib.get("name"),
-                    "element": part.attrib.get("element")
-                })
-            data["messages"].append({"name": message_name, "parts": parts})
-
-        # Extraer operaciones
-        for operation in root.findall(".//wsdl:portType/wsdl:operation", ns):
-            data["operations"].append({
-                "name": operation.attrib.get("name"),
-                "input": operation.find("wsdl:input", ns).attrib.get("message"),
-                "output": operation.find("wsdl:output", ns).attrib.get("message"),
-                "fault": operation.find("wsdl:fault", ns).attrib.get("message")
+    return extraer_datos_wsdl(root, ubicaciones[0] if ubicaciones else ""), futuros
+
+def extraer_datos_wsdl(root, schema_location):
+    """ Extrae del árbol del WSDL los detalles del servicio, mensajes y operaciones. """
+    ns = {
+        "wsdl": "http://schemas.xmlsoap.org/wsdl/",
+        "soap": "http://schemas.xmlsoap.org/wsdl/soap/",
+        "xsd": "http://www.w3.org/2001/XMLSchema"
+    }
+
+    schema = root.find(".//xsd:schema", ns)
+    data = {
+        "service_name": root.attrib.get("name"),
+        "target_namespace": schema.attrib.get("targetNamespace", "") if schema is not None else "",
+        "schema_location": schema_location,
+        "messages": [],
+        "operations": [],
+        "services": [],
+        "binding": None
+    }
+
+    # Extraer mensajes
+    for message in root.findall("wsdl:message", ns):
+        message_name = message.attrib.get("name")
+        parts = []
+        for part in message.findall("wsdl:part", ns):
+            parts.append({
+                "name": part.attrib.get("name"),
+                "element": part.attrib.get("element")
             })
-
-        # Extraer binding
-        binding = root.find(".//wsdl:binding", ns)
-        if binding is not None:
-            data["binding"] = binding.attrib.get("name")
-
-        # Extraer servicios y puertos
-        for service in root.findall("wsdl:service", ns):
-            ports = []
-            for port in service.findall("wsdl:port", ns):
-                address = port.find("soap:address", ns)
-                ports.append({
-                    "name": port.attrib.get("name"),
-                    "binding": port.attrib.get("binding"),
-                    "address": address.attrib.get("location") if address is not None else None
-                })
-            data["services"].append({
-                "name": service.attrib.get("name"),
-                "ports": ports
+        data["messages"].append({"name": message_name, "parts": parts})
+
+    # Extraer operaciones
+    for operation in root.findall(".//wsdl:portType/wsdl:operation", ns):
+        operacion = {
+            "name": operation.attrib.get("name"),
+            "input": None,
+            "output": None,
+            "fault": None
+        }
+        # Las operaciones sin fault o de un solo sentido (sin output) omiten esos nodos
+        for direccion in ("input", "output", "fault"):
+            nodo = operation.find(f"wsdl:{direccion}", ns)
+            if nodo is not None:
+                operacion[direccion] = nodo.attrib.get("message")
+        data["operations"].append(operacion)
+
+    # Extraer binding
+    binding = root.find(".//wsdl:binding", ns)
+    if binding is not None:
+        data["binding"] = binding.attrib.get("name")
+
+    # Extraer servicios y puertos
+    for service in root.findall("wsdl:service", ns):
+        ports = []
+        for port in service.findall("wsdl:port", ns):
+            address = port.find("soap:address", ns)
+            ports.append({
+                "name": port.attrib.get("name"),
+                "binding": port.attrib.get("binding"),
+                "address": address.attrib.get("location") if address is not None else None
             })
+        data["services"].append({
+            "name": service.attrib.get("name"),
+            "ports": ports
+        })
 
-        return data
-    except ET.ParseError as e:
-        print(f"Error al analizar el WSDL: {e}")
-        sys.exit(1)
+    return data
 
 def anidar_complex_type(messages, complex_types):
     """ Anida el ComplexType correspondiente dentro de cada part en messages. """
@@ -116,37 +146,57 @@ def anidar_complex_type(messages, complex_types):
                 part["ComplexType"] = complex_types[complex_type_name]
     return messages
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("\nUso: python script.py <url_wsdl>")
-        sys.exit(1)
-
-    url = sys.argv[1]
-    temp_wsdl = "temp.wsdl"
+def extraer_servicio(origen, carpeta_salida="N1-WSDL", comprimir=False, indice_campos=False):
+    """
+    Extrae el modelo de un WSDL (URL o archivo local, también .wsdl.gz) y lo guarda como JSON.
+
+    Argumentos:
+        origen (str): URL o ruta local del WSDL.
+        carpeta_salida (str): Carpeta donde se guarda el JSON.
+        comprimir (bool): Si es True se genera un .json.gz.
+        indice_campos (bool): Si es True se agrega la tabla plana de rutas de
+            campos por mensaje (field_index).
+
+    Retorno:
+        str: Ruta absoluta del archivo JSON generado.
+    """
+    # Analizar el WSDL mientras se lee; los esquemas se descargan en paralelo
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        wsdl_data, futuros = analizar_wsdl_en_flujo(origen, executor)
+
+        # Unir los complexType de todos los esquemas y anidarlos en los mensajes
+        complex_types = {}
+        if futuros:
+            for futuro in futuros:
+                complex_types.update(futuro.result())
+            wsdl_data["messages"] = anidar_complex_type(wsdl_data["messages"], complex_types)
 
-    # Descargar y analizar el WSDL
-    wsdl_path = descargar_archivo(url, temp_wsdl)
-    wsdl_data = analizar_wsdl(wsdl_path)
+        # Aplanar las rutas de campos de cada mensaje al terminar el anidado
+        if indice_campos:
+            wsdl_data["field_index"] = construir_indice_campos(wsdl_data, complex_types)
 
-    # Descargar y analizar el esquema XSD si existe
-    if wsdl_data["schema_location"]:
-        temp_schema = "temp_schema.xsd"
-        schema_path = descargar_archivo(wsdl_data["schema_location"], temp_schema)
-        complex_types = analizar_schema(schema_path)
-        wsdl_data["messages"] = anidar_complex_type(wsdl_data["messages"], complex_types)
-        os.remove(temp_schema)
+    # Huellas estructurales para comparar tipos, mensajes y operaciones entre servicios
+    wsdl_data["fingerprints"] = calcular_huellas(wsdl_data, complex_types)
 
-    # Crear carpeta N1-WSDL si no existe
-    output_folder = "N1-WSDL"
-    os.makedirs(output_folder, exist_ok=True)
+    # Crear carpeta de salida si no existe
+    os.makedirs(carpeta_salida, exist_ok=True)
 
     # Nombre del archivo JSON
-    file_name = f"{wsdl_data['service_name']}_N1-WSDL.json"
-    output_path = os.path.abspath(os.path.join(output_folder, file_name))
+    file_name = nombre_salida_json(f"{wsdl_data['service_name']}_N1-WSDL.json", comprimir)
+    output_path = os.path.abspath(os.path.join(carpeta_salida, file_name))
 
     # Guardar salida JSON
-    with open(output_path, "w", encoding="utf-8") as file:
-        json.dump(wsdl_data, file, indent=4, ensure_ascii=False)
+    guardar_json(wsdl_data, output_path)
+
+    return output_path
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("\nUso: python script.py <url_wsdl> [--comprimir] [--indice-campos]")
+        sys.exit(1)
 
-    os.remove(temp_wsdl)
-    print(output_path)
+    print(extraer_servicio(
+        sys.argv[1],
+        comprimir="--comprimir" in sys.argv[2:],
+        indice_campos="--indice-campos" in sys.argv[2:]
+    ))
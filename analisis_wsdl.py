@@ -1,32 +1,17 @@
 import xml.etree.ElementTree as ET
-import requests
 import os
 import json
 import sys
-from lxml import etree
-
-def descargar_wsdl(url, archivo_destino):
-    """
-    Descarga el archivo WSDL desde una URL y lo guarda localmente.
-    """
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        with open(archivo_destino, "wb") as file:
-            file.write(response.content)
-        print(f"Archivo WSDL descargado: {archivo_destino}")
-        return archivo_destino
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar el archivo WSDL: {e}")
-        sys.exit(1)
+from utilidades_wsdl import obtener_archivo
+from grafo_wsdl import cargar_esquemas, construir_grafo, parsear_con_prefijos, mensajes_fault, mensajes_operacion, operaciones_afectadas, tipos_sin_uso
 
 def cargar_wsdl(file_path):
     """
-    Carga el archivo WSDL y retorna el árbol raíz.
+    Carga el archivo WSDL y retorna el árbol raíz junto con los prefijos
+    en vigor en cada nodo (los necesita el grafo de dependencias).
     """
     try:
-        tree = ET.parse(file_path)
-        return tree.getroot()
+        return parsear_con_prefijos(file_path)
     except ET.ParseError as e:
         print(f"Error al analizar el archivo WSDL: {e}")
         sys.exit(1)
@@ -76,28 +61,44 @@ def analizar_bindings(root):
         if soap_binding is not None:
             print(f"  Protocolo: {soap_binding.attrib.get('transport')}")
 
-def analizar_excepciones(root):
+def analizar_excepciones(grafo):
     print("\nAnálisis: Identificar excepciones o fallos")
-    print("Este análisis lista los mensajes de error o excepciones definidos en el WSDL:")
-    for message in root.findall(".//{http://schemas.xmlsoap.org/wsdl/}message"):
-        if "Exception" in message.attrib.get('name', ''):
-            print(f"- Excepción: {message.attrib['name']}")
+    print("Este análisis lista los mensajes declarados como wsdl:fault en las operaciones del WSDL:")
+    for mensaje in mensajes_fault(grafo):
+        print(f"- Excepción: {mensaje}")
 
-def mapa_relaciones(root):
+def mapa_relaciones(grafo):
     print("\nAnálisis: Generar mapa de relaciones")
     print("Este análisis muestra cómo se relacionan las operaciones con sus mensajes de entrada y salida:")
-    for operation in root.findall(".//{http://schemas.xmlsoap.org/wsdl/}operation"):
-        print(f"- Operación: {operation.attrib['name']}")
-        input_msg = operation.find(".//{http://schemas.xmlsoap.org/wsdl/}input")
-        output_msg = operation.find(".//{http://schemas.xmlsoap.org/wsdl/}output")
-        if input_msg is not None:
-            print(f"  Entrada: {input_msg.attrib['message']}")
-        if output_msg is not None:
-            print(f"  Salida: {output_msg.attrib['message']}")
+    for _, operacion in sorted(grafo["nodos"]["operacion"]):
+        print(f"- Operación: {operacion}")
+        mensajes = mensajes_operacion(grafo, operacion)
+        for mensaje in mensajes["input"]:
+            print(f"  Entrada: {mensaje}")
+        for mensaje in mensajes["output"]:
+            print(f"  Salida: {mensaje}")
+
+def analizar_impacto(grafo, tipo):
+    print("\nAnálisis: Impacto de un cambio en un tipo")
+    print("Este análisis lista las operaciones que dependen directa o indirectamente del tipo indicado:")
+    operaciones = operaciones_afectadas(grafo, tipo)
+    if operaciones:
+        for operacion in operaciones:
+            print(f"- Operación afectada: {operacion}")
+    else:
+        print(f"Ninguna operación depende del tipo '{tipo}'.")
+
+def listar_tipos_sin_uso(grafo):
+    print("\nAnálisis: Listar tipos sin uso")
+    print("Este análisis lista los tipos definidos en el esquema que ninguna operación utiliza:")
+    for tipo in tipos_sin_uso(grafo):
+        print(f"- Tipo: {tipo}")
 
 def validar_estructura(file_path):
     print("\nAnálisis: Validar la estructura del WSDL")
     print("Este análisis valida si el archivo WSDL cumple con el estándar XML:")
+    # lxml solo se importa cuando se pide la validación
+    from lxml import etree
     try:
         etree.parse(file_path)
         print("El archivo WSDL es válido.")
@@ -129,49 +130,76 @@ def mostrar_menu():
         "Identificar excepciones o fallos",
         "Generar mapa de relaciones",
         "Validar la estructura del WSDL",
-        "Exportar la estructura a JSON"
+        "Exportar la estructura a JSON",
+        "Analizar impacto de un cambio en un tipo",
+        "Listar tipos sin uso"
     ]
     for i, opcion in enumerate(opciones, 1):
         print(f"{i}. {opcion}")
     return opciones
 
+def ejecutar_analisis(root, wsdl_path, seleccion, opciones, origen=None, ambitos=None):
+    """
+    Ejecuta el análisis seleccionado (1-N) sobre el WSDL cargado.
+
+    El grafo de dependencias se construye sobre el root ya analizado. Solo
+    los análisis de tipos (10 y 11) descargan los esquemas referenciados con
+    xsd:include/xsd:import, resueltos respecto a origen (la URL o ruta
+    original del WSDL).
+    """
+    if not 1 <= seleccion <= len(opciones):
+        print("Opción no válida.")
+        return
+    print(f"\nHas seleccionado: {opciones[seleccion - 1]}")
+    grafo = None
+    if seleccion in (6, 7):
+        grafo = construir_grafo(root)
+    elif seleccion in (10, 11):
+        grafo = construir_grafo(root, cargar_esquemas(root, origen or wsdl_path), ambitos)
+    if seleccion == 1:
+        listar_mensajes(root)
+    elif seleccion == 2:
+        listar_operaciones(root)
+    elif seleccion == 3:
+        listar_tipos(root)
+    elif seleccion == 4:
+        obtener_url_servicio(root)
+    elif seleccion == 5:
+        analizar_bindings(root)
+    elif seleccion == 6:
+        analizar_excepciones(grafo)
+    elif seleccion == 7:
+        mapa_relaciones(grafo)
+    elif seleccion == 8:
+        validar_estructura(wsdl_path)
+    elif seleccion == 9:
+        exportar_json(root)
+    elif seleccion == 10:
+        analizar_impacto(grafo, input("Nombre del tipo: ").strip())
+    elif seleccion == 11:
+        listar_tipos_sin_uso(grafo)
+
+def analizar(origen, seleccion=None):
+    """
+    Descarga el WSDL (o usa la ruta local) y ejecuta un análisis; si no se
+    indica la opción se pide en el menú. El archivo temporal se elimina al
+    terminar.
+    """
+    temp_file = "temp.wsdl"
+    wsdl_path, es_temporal = obtener_archivo(origen, temp_file, mostrar=True)
+    try:
+        root, ambitos = cargar_wsdl(wsdl_path)
+        opciones = mostrar_menu()
+        if seleccion is None:
+            seleccion = int(input(f"\nElige una opción (1-{len(opciones)}): "))
+        ejecutar_analisis(root, wsdl_path, seleccion, opciones, origen, ambitos)
+    finally:
+        if es_temporal:
+            os.remove(wsdl_path)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Uso: python analisis_wsdl.py <url_wsdl>")
         sys.exit(1)
 
-    url = sys.argv[1]
-    temp_file = "temp.wsdl"
-
-    # Descargar el archivo WSDL
-    wsdl_path = descargar_wsdl(url, temp_file)
-    if wsdl_path:
-        root = cargar_wsdl(wsdl_path)
-        if root:
-            opciones = mostrar_menu()
-            seleccion = int(input("\nElige una opción (1-9): "))
-            if 1 <= seleccion <= 9:
-                print(f"\nHas seleccionado: {opciones[seleccion - 1]}")
-                if seleccion == 1:
-                    listar_mensajes(root)
-                elif seleccion == 2:
-                    listar_operaciones(root)
-                elif seleccion == 3:
-                    listar_tipos(root)
-                elif seleccion == 4:
-                    obtener_url_servicio(root)
-                elif seleccion == 5:
-                    analizar_bindings(root)
-                elif seleccion == 6:
-                    analizar_excepciones(root)
-                elif seleccion == 7:
-                    mapa_relaciones(root)
-                elif seleccion == 8:
-                    validar_estructura(wsdl_path)
-                elif seleccion == 9:
-                    exportar_json(root)
-            else:
-                print("Opción no válida.")
-        else:
-            print("No se pudo analizar el archivo WSDL.")
-        os.remove(temp_file)
+    analizar(sys.argv[1])
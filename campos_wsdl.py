@@ -0,0 +1,124 @@
+import sys
+from collections import defaultdict
+from utilidades_wsdl import cargar_json, nombre_local
+
+COLUMNAS_CAMPO = ("path", "type", "minOccurs", "maxOccurs")
+
+def _campos_de_tipo(elementos, ruta, complex_types, visitados, columnas):
+    """
+    Agrega una fila por cada elemento del tipo y desciende en los tipos
+    complejos anidados. visitados evita ciclos en tipos recursivos.
+    """
+    for elemento in elementos:
+        ruta_campo = f"{ruta}.{elemento.get('name')}"
+        columnas["path"].append(ruta_campo)
+        columnas["type"].append(elemento.get("type"))
+        columnas["minOccurs"].append(elemento.get("minOccurs", "1"))
+        columnas["maxOccurs"].append(elemento.get("maxOccurs", "1"))
+        tipo = nombre_local(elemento.get("type"))
+        if tipo in complex_types and tipo not in visitados:
+            visitados.add(tipo)
+            _campos_de_tipo(complex_types[tipo], ruta_campo, complex_types, visitados, columnas)
+            visitados.discard(tipo)
+
+def construir_indice_campos(modelo, complex_types):
+    """
+    Aplana las cargas de cada mensaje en una tabla por columnas con una fila
+    por ruta de campo (ruta con puntos, tipo, minOccurs y maxOccurs).
+
+    Las columnas se guardan una sola vez por mensaje; la lista "operations"
+    relaciona cada operación y dirección con su mensaje, de modo que los
+    nombres de operación y mensaje no se repiten por fila.
+
+    Argumentos:
+        modelo (dict): Modelo de N2-WSDL con los ComplexType ya anidados.
+        complex_types (dict): complexType del esquema (nombre -> elementos).
+
+    Retorno:
+        dict: {"operations": [[operación, dirección, mensaje], ...],
+        "messages": {mensaje: {columna: [valores]}}}.
+    """
+    mensajes = {}
+    for message in modelo.get("messages", []):
+        columnas = {columna: [] for columna in COLUMNAS_CAMPO}
+        for part in message.get("parts", []):
+            elemento = nombre_local(part.get("element")) or part.get("name")
+            if part.get("ComplexType") is not None:
+                _campos_de_tipo(part["ComplexType"], elemento, complex_types, set(), columnas)
+        mensajes[message.get("name")] = columnas
+
+    operaciones = []
+    for operation in modelo.get("operations", []):
+        for direccion in ("input", "output", "fault"):
+            mensaje = nombre_local(operation.get(direccion))
+            if mensaje in mensajes:
+                operaciones.append([operation.get("name"), direccion, mensaje])
+    return {"operations": operaciones, "messages": mensajes}
+
+def indexar(indice_campos):
+    """
+    Construye los índices de búsqueda directa sobre la tabla de campos.
+
+    Retorno:
+        dict: Para "path", "field" (último segmento de la ruta) y "type" (sin
+        prefijo), un diccionario valor -> posiciones (mensaje, fila).
+    """
+    indice = {"path": defaultdict(list), "field": defaultdict(list), "type": defaultdict(list)}
+    for mensaje, columnas in indice_campos["messages"].items():
+        for fila, (ruta, tipo) in enumerate(zip(columnas["path"], columnas["type"])):
+            indice["path"][ruta].append((mensaje, fila))
+            indice["field"][ruta.rsplit(".", 1)[-1]].append((mensaje, fila))
+            indice["type"][nombre_local(tipo)].append((mensaje, fila))
+
+    usos = defaultdict(list)
+    for operacion, direccion, mensaje in indice_campos["operations"]:
+        usos[mensaje].append((operacion, direccion))
+
+    return {
+        "messages": indice_campos["messages"],
+        "usos": dict(usos),
+        "path": dict(indice["path"]),
+        "field": dict(indice["field"]),
+        "type": dict(indice["type"])
+    }
+
+def _filas(indice, posiciones):
+    filas = []
+    for mensaje, fila in posiciones:
+        columnas = indice["messages"][mensaje]
+        campo = {columna: columnas[columna][fila] for columna in COLUMNAS_CAMPO}
+        for operacion, direccion in indice["usos"].get(mensaje, ()):
+            filas.append(dict(campo, operation=operacion, direction=direccion, message=mensaje))
+    return filas
+
+def buscar_por_ruta(indice, ruta):
+    """
+    Devuelve las filas cuya ruta con puntos coincide exactamente.
+    """
+    return _filas(indice, indice["path"].get(ruta, ()))
+
+def buscar_por_campo(indice, nombre):
+    """
+    Devuelve las filas de todos los campos con ese nombre, en cualquier mensaje.
+    """
+    return _filas(indice, indice["field"].get(nombre, ()))
+
+def buscar_por_tipo(indice, tipo):
+    """
+    Devuelve las filas de todos los campos de un tipo (con o sin prefijo).
+    """
+    return _filas(indice, indice["type"].get(nombre_local(tipo), ()))
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Uso: python campos_wsdl.py <ruta_json> <campo>")
+        sys.exit(1)
+
+    modelo = cargar_json(sys.argv[1])
+    indice_campos = modelo.get("datos", modelo).get("field_index")
+    if indice_campos is None:
+        print("El JSON no incluye el índice de campos (genéralo con --indice-campos).")
+        sys.exit(1)
+
+    for fila in buscar_por_campo(indexar(indice_campos), sys.argv[2]):
+        print(f"- {fila['operation']} [{fila['direction']}] {fila['path']}: {fila['type']} ({fila['minOccurs']}..{fila['maxOccurs']})")
@@ -0,0 +1,348 @@
+import xml.etree.ElementTree as ET
+import io
+import sys
+from collections import defaultdict, deque
+from utilidades_wsdl import leer_bloques, nombre_local, resolver_ubicacion
+
+WSDL_NS = "{http://schemas.xmlsoap.org/wsdl/}"
+XSD_NS = "{http://www.w3.org/2001/XMLSchema}"
+XSD_REFERENCIAS = (XSD_NS + "include", XSD_NS + "import")
+
+def nombre_calificado(qname, prefijos, espacio):
+    """
+    Resuelve un nombre con prefijo (tns:Nombre) a la notación {uri}Nombre.
+
+    prefijos son los prefijos en vigor en el nodo que contiene el nombre.
+    Los nombres sin prefijo usan el espacio de nombres por defecto; si el
+    prefijo no está declarado se usa el espacio de nombres del contexto (el
+    targetNamespace del esquema o del WSDL).
+    """
+    if not qname:
+        return None
+    qname = qname.strip()
+    if ":" in qname:
+        prefijo, local = qname.split(":", 1)
+        uri = (prefijos or {}).get(prefijo, espacio)
+    else:
+        local = qname
+        uri = (prefijos or {}).get("", espacio)
+    return f"{{{uri}}}{local}" if uri else local
+
+def parsear_con_prefijos(fuente):
+    """
+    Analiza un documento XML y devuelve su raíz junto con los prefijos de
+    espacio de nombres en vigor en cada elemento (ElementTree no los conserva
+    en el árbol).
+
+    Un prefijo redeclarado en un subárbol (p. ej. tns en el xsd:schema de un
+    WSDL que ya lo usa en la raíz) solo cambia de significado dentro de él.
+    Los elementos que no declaran prefijos comparten el diccionario de su padre.
+
+    Retorno:
+        tuple: (raíz, ámbitos), donde ámbitos relaciona cada elemento con su
+        diccionario prefijo -> URI.
+    """
+    ambitos = {}
+    pila = [{}]
+    declarados = {}
+    contexto = ET.iterparse(fuente, events=("start-ns", "start", "end"))
+    for evento, dato in contexto:
+        if evento == "start-ns":
+            prefijo, uri = dato
+            declarados[prefijo] = uri
+        elif evento == "start":
+            if declarados:
+                pila.append({**pila[-1], **declarados})
+                declarados = {}
+            else:
+                pila.append(pila[-1])
+            ambitos[dato] = pila[-1]
+        else:
+            pila.pop()
+    return contexto.root, ambitos
+
+def cargar_esquemas(root, origen):
+    """
+    Descarga y analiza los esquemas referenciados con xsd:include/xsd:import
+    desde el WSDL, siguiendo también las referencias de esos esquemas.
+
+    Un esquema incluido sin targetNamespace adopta el del esquema que lo
+    incluye, como indica XSD.
+
+    Retorno:
+        list: Pares (nodo xsd:schema, ámbitos de prefijos del documento del esquema).
+    """
+    pendientes = deque()
+    for schema in root.iter(XSD_NS + "schema"):
+        pendientes.append((schema, origen))
+
+    visitados = set()
+    esquemas = []
+    while pendientes:
+        schema, base = pendientes.popleft()
+        for referencia in schema.findall("*"):
+            if referencia.tag not in XSD_REFERENCIAS or not referencia.attrib.get("schemaLocation"):
+                continue
+            ubicacion = resolver_ubicacion(base, referencia.attrib["schemaLocation"])
+            if ubicacion in visitados:
+                continue
+            visitados.add(ubicacion)
+            try:
+                externo, ambitos_externo = parsear_con_prefijos(io.BytesIO(b"".join(leer_bloques(ubicacion))))
+            except ET.ParseError as e:
+                print(f"Error al analizar el esquema {ubicacion}: {e}")
+                continue
+            if referencia.tag == XSD_NS + "include" and "targetNamespace" not in externo.attrib:
+                externo.set("targetNamespace", schema.attrib.get("targetNamespace", ""))
+            esquemas.append((externo, ambitos_externo))
+            pendientes.append((externo, ubicacion))
+    return esquemas
+
+def cargar_documento(origen, ruta=None):
+    """
+    Lee un WSDL (URL o ruta, también .wsdl.gz) con los prefijos en vigor en
+    cada nodo y los esquemas externos que referencia.
+
+    Argumentos:
+        origen (str): URL o ruta del WSDL; se usa para resolver los schemaLocation relativos.
+        ruta (str): Copia local ya descargada del WSDL, si existe.
+
+    Retorno:
+        tuple: (raíz, esquemas, ámbitos), listos para construir_grafo.
+    """
+    try:
+        root, ambitos = parsear_con_prefijos(io.BytesIO(b"".join(leer_bloques(ruta or origen))))
+    except ET.ParseError as e:
+        print(f"Error al analizar el archivo WSDL {origen}: {e}")
+        sys.exit(1)
+    return root, cargar_esquemas(root, origen), ambitos
+
+def nuevo_grafo():
+    """
+    Crea un grafo vacío de dependencias.
+
+    Los nodos son tuplas (clase, nombre) donde clase es "servicio", "binding",
+    "operacion", "mensaje", "parte", "elemento" o "tipo". Los elementos y
+    tipos se nombran como {targetNamespace}Nombre. Las aristas van de quien
+    usa hacia lo usado (operación -> mensaje -> parte -> elemento -> tipo).
+    """
+    return {
+        "nodos": defaultdict(set),
+        "sucesores": defaultdict(set),
+        "predecesores": defaultdict(set),
+        "por_nombre": defaultdict(set),
+        "roles": {},
+        "faults": set()
+    }
+
+def _enlazar(grafo, origen, destino, rol=None):
+    grafo["sucesores"][origen].add(destino)
+    grafo["predecesores"][destino].add(origen)
+    if rol is not None:
+        grafo["roles"][(origen, destino)] = rol
+
+def _registrar(grafo, nodo):
+    grafo["nodos"][nodo[0]].add(nodo)
+    grafo["por_nombre"][(nodo[0], nombre_local(nodo[1].split("}")[-1]))].add(nodo)
+
+def _enlazar_contenido(grafo, origen, nodo_xml, ambitos, espacio):
+    """
+    Recorre una sola vez el contenido de un elemento o tipo del esquema y
+    enlaza los tipos y elementos que referencia.
+    """
+    for hijo in nodo_xml.iter():
+        if hijo is nodo_xml:
+            continue
+        prefijos = ambitos.get(hijo)
+        if hijo.tag in (XSD_NS + "element", XSD_NS + "attribute"):
+            if "type" in hijo.attrib:
+                _enlazar(grafo, origen, ("tipo", nombre_calificado(hijo.attrib["type"], prefijos, espacio)))
+            if "ref" in hijo.attrib:
+                _enlazar(grafo, origen, ("elemento", nombre_calificado(hijo.attrib["ref"], prefijos, espacio)))
+        elif hijo.tag in (XSD_NS + "extension", XSD_NS + "restriction"):
+            if "base" in hijo.attrib:
+                _enlazar(grafo, origen, ("tipo", nombre_calificado(hijo.attrib["base"], prefijos, espacio)))
+
+def agregar_esquema(grafo, schema, ambitos=None):
+    """
+    Agrega al grafo los elementos y tipos globales de un xsd:schema.
+    """
+    ambitos = ambitos or {}
+    espacio = schema.attrib.get("targetNamespace", "")
+    for nodo in schema:
+        nombre = nodo.attrib.get("name")
+        if nombre is None:
+            continue
+        if nodo.tag == XSD_NS + "element":
+            origen = ("elemento", nombre_calificado(nombre, None, espacio))
+            if "type" in nodo.attrib:
+                _enlazar(grafo, origen, ("tipo", nombre_calificado(nodo.attrib["type"], ambitos.get(nodo), espacio)))
+        elif nodo.tag in (XSD_NS + "complexType", XSD_NS + "simpleType"):
+            origen = ("tipo", nombre_calificado(nombre, None, espacio))
+        else:
+            continue
+        _registrar(grafo, origen)
+        _enlazar_contenido(grafo, origen, nodo, ambitos, espacio)
+
+def agregar_documento(grafo, root, servicio=None, esquemas=(), ambitos=None):
+    """
+    Agrega un documento WSDL al grafo recorriendo sus hijos directos una sola vez.
+
+    Si se indica servicio, los nodos propios del WSDL (operaciones, mensajes,
+    partes, bindings) se prefijan con él para poder combinar varios documentos
+    en un mismo catálogo; los elementos y tipos del esquema se comparten solo
+    si coinciden en espacio de nombres y nombre.
+    """
+    ambitos = ambitos or {}
+    espacio = root.attrib.get("targetNamespace", "")
+
+    def clave(nombre):
+        nombre = nombre_local(nombre)
+        return f"{servicio}.{nombre}" if servicio else nombre
+
+    for nodo in root:
+        if nodo.tag == WSDL_NS + "types":
+            for schema in nodo.findall(XSD_NS + "schema"):
+                agregar_esquema(grafo, schema, ambitos)
+
+        elif nodo.tag == WSDL_NS + "message":
+            mensaje = ("mensaje", clave(nodo.attrib.get("name")))
+            _registrar(grafo, mensaje)
+            for part in nodo.findall(WSDL_NS + "part"):
+                parte = ("parte", f"{mensaje[1]}.{part.attrib.get('name')}")
+                _registrar(grafo, parte)
+                _enlazar(grafo, mensaje, parte)
+                if "element" in part.attrib:
+                    _enlazar(grafo, parte, ("elemento", nombre_calificado(part.attrib["element"], ambitos.get(part), espacio)))
+                if "type" in part.attrib:
+                    _enlazar(grafo, parte, ("tipo", nombre_calificado(part.attrib["type"], ambitos.get(part), espacio)))
+
+        elif nodo.tag == WSDL_NS + "portType":
+            for operation in nodo.findall(WSDL_NS + "operation"):
+                operacion = ("operacion", clave(operation.attrib.get("name")))
+                _registrar(grafo, operacion)
+                for rol in ("input", "output", "fault"):
+                    for referencia in operation.findall(WSDL_NS + rol):
+                        if "message" not in referencia.attrib:
+                            continue
+                        mensaje = ("mensaje", clave(referencia.attrib["message"]))
+                        _enlazar(grafo, operacion, mensaje, rol)
+                        if rol == "fault":
+                            grafo["faults"].add(mensaje)
+
+        elif nodo.tag == WSDL_NS + "binding":
+            binding = ("binding", clave(nodo.attrib.get("name")))
+            _registrar(grafo, binding)
+            for operation in nodo.findall(WSDL_NS + "operation"):
+                _enlazar(grafo, binding, ("operacion", clave(operation.attrib.get("name"))))
+
+        elif nodo.tag == WSDL_NS + "service":
+            nombre_servicio = ("servicio", clave(nodo.attrib.get("name")))
+            _registrar(grafo, nombre_servicio)
+            for port in nodo.findall(WSDL_NS + "port"):
+                if "binding" in port.attrib:
+                    _enlazar(grafo, nombre_servicio, ("binding", clave(port.attrib["binding"])))
+
+    for schema, ambitos_schema in esquemas:
+        agregar_esquema(grafo, schema, ambitos_schema)
+    return grafo
+
+def construir_grafo(root, esquemas=(), ambitos=None):
+    """
+    Construye el grafo de dependencias de un único documento WSDL.
+
+    Argumentos:
+        root (Element): Nodo raíz del WSDL.
+        esquemas (iterable): Pares (xsd:schema, ámbitos) de los esquemas externos.
+        ambitos (dict): Prefijos en vigor en cada nodo del WSDL, como los
+            devuelve parsear_con_prefijos.
+
+    Retorno:
+        dict: Grafo con listas de adyacencia en ambos sentidos.
+    """
+    return agregar_documento(nuevo_grafo(), root, esquemas=esquemas, ambitos=ambitos)
+
+def construir_grafo_catalogo(documentos):
+    """
+    Construye un único grafo para un catálogo de documentos WSDL.
+
+    Argumentos:
+        documentos (iterable): Tuplas (root, esquemas, ámbitos) de cada
+            servicio, como las devuelve cargar_documento.
+
+    Retorno:
+        dict: Grafo combinado; los nodos propios de cada WSDL se prefijan con
+        el nombre del servicio.
+    """
+    grafo = nuevo_grafo()
+    for root, esquemas, ambitos in documentos:
+        servicio = root.attrib.get("name", "UnnamedService")
+        agregar_documento(grafo, root, servicio=servicio, esquemas=esquemas, ambitos=ambitos)
+    return grafo
+
+def alcanzables(grafo, origenes, sentido="sucesores"):
+    """
+    Devuelve el conjunto de nodos alcanzables desde los orígenes (BFS).
+    """
+    adyacencia = grafo[sentido]
+    visitados = set(origenes)
+    pendientes = deque(visitados)
+    while pendientes:
+        nodo = pendientes.popleft()
+        for vecino in adyacencia.get(nodo, ()):
+            if vecino not in visitados:
+                visitados.add(vecino)
+                pendientes.append(vecino)
+    return visitados
+
+def operaciones_afectadas(grafo, nombre, clase="tipo"):
+    """
+    Lista las operaciones que dependen (directa o indirectamente) de un tipo o elemento.
+
+    El nombre puede darse como {uri}Nombre para un espacio de nombres
+    concreto; con prefijo o sin él se consideran todos los espacios de
+    nombres que definen ese nombre.
+    """
+    if nombre.startswith("{"):
+        origenes = [(clase, nombre)]
+    else:
+        origenes = grafo["por_nombre"].get((clase, nombre_local(nombre)), ())
+    return sorted(n for c, n in alcanzables(grafo, origenes, "predecesores") if c == "operacion")
+
+def tipos_sin_uso(grafo):
+    """
+    Lista los tipos definidos en los esquemas que ninguna operación utiliza.
+    """
+    usados = alcanzables(grafo, grafo["nodos"]["operacion"])
+    return sorted(n for _, n in grafo["nodos"]["tipo"] - usados)
+
+def mensajes_fault(grafo):
+    """
+    Lista los mensajes referenciados desde algún wsdl:fault.
+    """
+    return sorted(n for _, n in grafo["faults"])
+
+def mensajes_operacion(grafo, nombre):
+    """
+    Devuelve los mensajes de una operación agrupados por rol (input, output, fault).
+    """
+    operacion = ("operacion", nombre)
+    mensajes = {"input": [], "output": [], "fault": []}
+    for destino in grafo["sucesores"].get(operacion, ()):
+        rol = grafo["roles"].get((operacion, destino))
+        if rol in mensajes:
+            mensajes[rol].append(destino[1])
+    for rol in mensajes:
+        mensajes[rol].sort()
+    return mensajes
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Uso: python grafo_wsdl.py <tipo> <archivo_wsdl> [archivo_wsdl ...]")
+        sys.exit(1)
+
+    tipo = sys.argv[1]
+    grafo = construir_grafo_catalogo(cargar_documento(ruta) for ruta in sys.argv[2:])
+    print(f"Operaciones afectadas por un cambio en '{tipo}':")
+    for operacion in operaciones_afectadas(grafo, tipo):
+        print(f"- {operacion}")
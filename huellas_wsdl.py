@@ -0,0 +1,237 @@
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from utilidades_wsdl import cargar_json, nombre_local
+
+def huella(estructura):
+    """
+    Calcula la huella (hash) de una estructura ya normalizada.
+
+    Se serializa como JSON canónico (claves ordenadas, sin espacios) para que
+    el orden de las claves y el formato no influyan en el resultado.
+    """
+    canonico = json.dumps(estructura, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonico.encode("utf-8"), digest_size=16).hexdigest()
+
+def calcular_huellas(modelo, complex_types=None):
+    """
+    Calcula de abajo hacia arriba las huellas estructurales del modelo
+    N1-WSDL: ComplexType -> mensaje -> operación -> servicio.
+
+    Cada huella se calcula a partir de las huellas del nivel inferior (árbol
+    de Merkle): la entrada de cada elemento incluye la huella del ComplexType
+    al que apunta, así que un cambio en un tipo anidado llega hasta sus
+    mensajes, operaciones y el servicio. Los tipos recursivos (cada
+    componente fuertemente conexa del grafo de referencias) se resumen en
+    una huella común: dentro del ciclo las referencias aportan solo el nombre
+    del tipo, y cada miembro combina su nombre con la huella del ciclo. Así
+    la huella de un tipo no depende del orden del esquema ni de qué otros
+    tipos lo referencian.
+
+    Se ignoran los prefijos de los nombres calificados, los espacios y el
+    orden de tipos, mensajes, operaciones, servicios y puertos dentro del
+    documento. El orden de los elementos de una secuencia y su cardinalidad
+    (minOccurs/maxOccurs) sí cuentan porque forman parte del contrato XML.
+
+    Argumentos:
+        modelo (dict): Modelo generado por N2-WSDL.
+        complex_types (dict): complexType del esquema (nombre -> elementos). Si se
+            omite, se toman los ComplexType anidados en las partes, nombrados
+            como lo hace anidar_complex_type.
+
+    Retorno:
+        dict: Huellas del servicio y de cada ComplexType, mensaje y operación.
+    """
+    if complex_types is None:
+        complex_types = {}
+        for message in modelo.get("messages", []):
+            for part in message.get("parts", []):
+                if part.get("ComplexType") is not None:
+                    elemento = nombre_local(part.get("element"))
+                    complex_types[elemento[0].upper() + elemento[1:]] = part["ComplexType"]
+
+    tipos = {}
+    indices, bajos, pila, en_pila = {}, {}, [], set()
+
+    def referencias(nombre):
+        return [t for t in (nombre_local(e.get("type")) for e in complex_types[nombre]) if t in complex_types]
+
+    def entradas(elementos, componente):
+        lista = []
+        for elemento in elementos:
+            tipo = nombre_local(elemento.get("type"))
+            if tipo in componente:
+                anidado = ["ciclo", tipo]
+            else:
+                anidado = tipos.get(tipo)
+            lista.append([
+                nombre_local(elemento.get("name")),
+                tipo,
+                elemento.get("minOccurs", "1"),
+                elemento.get("maxOccurs", "1"),
+                anidado
+            ])
+        return lista
+
+    def huella_componente(componente):
+        nombre = min(componente)
+        if len(componente) == 1 and nombre not in referencias(nombre):
+            tipos[nombre] = huella(entradas(complex_types[nombre], componente))
+            return
+        # Tipos recursivos: el ciclo se resume en una sola huella, igual se entre por donde se entre
+        conjunto = huella(sorted([n, entradas(complex_types[n], componente)] for n in componente))
+        for n in componente:
+            tipos[n] = huella({"type": n, "component": conjunto})
+
+    def visitar(nombre):
+        # Tarjan: las componentes fuertemente conexas salen con sus dependencias ya resueltas
+        indices[nombre] = bajos[nombre] = len(indices)
+        pila.append(nombre)
+        en_pila.add(nombre)
+        for tipo in referencias(nombre):
+            if tipo not in indices:
+                visitar(tipo)
+                bajos[nombre] = min(bajos[nombre], bajos[tipo])
+            elif tipo in en_pila:
+                bajos[nombre] = min(bajos[nombre], indices[tipo])
+        if bajos[nombre] == indices[nombre]:
+            componente = set()
+            while nombre not in componente:
+                tipo = pila.pop()
+                en_pila.discard(tipo)
+                componente.add(tipo)
+            huella_componente(componente)
+
+    for nombre in sorted(complex_types):
+        if nombre not in indices:
+            visitar(nombre)
+    tipos = {nombre: tipos[nombre] for nombre in sorted(tipos)}
+
+    def huella_parte(part):
+        elementos = part.get("ComplexType")
+        if elementos is None:
+            return None
+        elemento = nombre_local(part.get("element")) or ""
+        nombre = elemento[:1].upper() + elemento[1:]
+        if complex_types.get(nombre) == elementos:
+            return tipos[nombre]
+        return huella(entradas(elementos, ()))
+
+    mensajes = {}
+    for message in modelo.get("messages", []):
+        partes = []
+        for part in message.get("parts", []):
+            partes.append({
+                "name": nombre_local(part.get("name")),
+                "element": nombre_local(part.get("element")),
+                "ComplexType": huella_parte(part)
+            })
+        mensajes[nombre_local(message.get("name"))] = huella({"name": nombre_local(message.get("name")), "parts": partes})
+
+    def huella_mensaje(referencia):
+        nombre = nombre_local(referencia)
+        return mensajes.get(nombre, nombre)
+
+    operaciones = {}
+    for operation in modelo.get("operations", []):
+        operaciones[operation.get("name")] = huella({
+            "name": nombre_local(operation.get("name")),
+            "input": huella_mensaje(operation.get("input")),
+            "output": huella_mensaje(operation.get("output")),
+            "fault": huella_mensaje(operation.get("fault"))
+        })
+
+    puertos = []
+    for service in modelo.get("services", []):
+        for port in service.get("ports", []):
+            puertos.append([
+                nombre_local(service.get("name")),
+                nombre_local(port.get("name")),
+                nombre_local(port.get("binding")),
+                (port.get("address") or "").strip()
+            ])
+
+    servicio = huella({
+        "service_name": (modelo.get("service_name") or "").strip(),
+        "target_namespace": (modelo.get("target_namespace") or "").strip(),
+        "binding": nombre_local(modelo.get("binding")),
+        "complex_types": sorted([nombre, valor] for nombre, valor in tipos.items()),
+        "messages": sorted(mensajes.values()),
+        "operations": sorted(operaciones.values()),
+        "ports": sorted(puertos)
+    })
+
+    return {
+        "service": servicio,
+        "complex_types": tipos,
+        "messages": mensajes,
+        "operations": operaciones
+    }
+
+def obtener_huellas(modelo):
+    """
+    Devuelve las huellas guardadas en el modelo (o en su sección "datos" si
+    viene del reorganizador), calculándolas si el JSON es anterior a ellas.
+    """
+    datos = modelo.get("datos", modelo)
+    if "fingerprints" not in datos:
+        datos = dict(datos, service_name=modelo.get("control", {}).get("service_name", datos.get("service_name")))
+        return calcular_huellas(datos)
+    return datos["fingerprints"]
+
+def indexar_catalogo(modelos):
+    """
+    Construye un índice huella -> entidades para un catálogo de servicios.
+
+    Argumentos:
+        modelos (iterable): Pares (nombre del servicio, modelo).
+
+    Retorno:
+        dict: Para cada huella, la lista de (servicio, clase, nombre) que la comparten.
+    """
+    indice = defaultdict(list)
+    for servicio, modelo in modelos:
+        huellas = obtener_huellas(modelo)
+        indice[huellas["service"]].append((servicio, "service", servicio))
+        for clase in ("complex_types", "messages", "operations"):
+            for nombre, valor in huellas[clase].items():
+                indice[valor].append((servicio, clase, nombre))
+    return dict(indice)
+
+def comparar_huellas(anteriores, actuales):
+    """
+    Compara las huellas de dos ejecuciones de un mismo servicio.
+
+    Retorno:
+        dict: Para cada clase, los nombres añadidos, eliminados y modificados
+        (vacío si el servicio no cambió).
+    """
+    if anteriores["service"] == actuales["service"]:
+        return {}
+    cambios = {}
+    for clase in ("complex_types", "messages", "operations"):
+        antes, despues = anteriores.get(clase, {}), actuales.get(clase, {})
+        cambios[clase] = {
+            "added": sorted(set(despues) - set(antes)),
+            "removed": sorted(set(antes) - set(despues)),
+            "changed": sorted(n for n in set(antes) & set(despues) if antes[n] != despues[n])
+        }
+    return cambios
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python huellas_wsdl.py <ruta_json> [ruta_json ...]")
+        sys.exit(1)
+
+    modelos = []
+    for ruta in sys.argv[1:]:
+        modelo = cargar_json(ruta)
+        nombre = modelo.get("service_name") or modelo.get("control", {}).get("service_name") or ruta
+        modelos.append((nombre, modelo))
+
+    print("Entidades compartidas entre servicios:")
+    for valor, entidades in indexar_catalogo(modelos).items():
+        servicios = {servicio for servicio, _, _ in entidades}
+        if len(servicios) > 1:
+            print(f"- {valor}: " + ", ".join(f"{s}/{c}/{n}" for s, c, n in entidades))
@@ -1,22 +1,7 @@
 import xml.etree.ElementTree as ET
-import requests
 import sys
 import os
-
-def descargar_wsdl(url, archivo_destino):
-    """
-    Descarga el archivo WSDL desde una URL y lo guarda localmente.
-    """
-    try:
-        response = requests.get(url)
-        response.raise_for_status()  # Verifica si hubo errores en la solicitud
-        with open(archivo_destino, "wb") as file:
-            file.write(response.content)
-        print(f"Archivo WSDL descargado: {archivo_destino}")
-        return archivo_destino
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar el archivo WSDL: {e}")
-        sys.exit(1)
+from utilidades_wsdl import obtener_archivo
 
 def mostrar_estructura_niveles(nodo, nivel=0):
     """
@@ -27,26 +12,31 @@ def mostrar_estructura_niveles(nodo, nivel=0):
     for subnodo in nodo:
         mostrar_estructura_niveles(subnodo, nivel + 1)
 
+def mostrar_jerarquia(origen):
+    """
+    Descarga el WSDL (o lo descomprime si es un .wsdl.gz local) y muestra su
+    estructura general, eliminando después el archivo temporal.
+    """
+    temp_file = "temp.wsdl"
+    wsdl_path, es_temporal = obtener_archivo(origen, temp_file, mostrar=True)
+
+    # Analizar y mostrar la estructura general
+    try:
+        tree = ET.parse(wsdl_path)
+        root = tree.getroot()
+        print("Estructura general del WSDL:")
+        mostrar_estructura_niveles(root)
+    except ET.ParseError:
+        print("Error al analizar el archivo. Asegúrate de que sea un archivo WSDL válido.")
+        sys.exit(1)
+    finally:
+        # Eliminar archivo temporal
+        if es_temporal:
+            os.remove(wsdl_path)
+
 if __name__ == "__main__":
     # Verificar si se proporcionó una URL como argumento
     if len(sys.argv) < 2:
         print("Uso: python script.py <url_wsdl>")
     else:
-        url_wsdl = sys.argv[1]
-        temp_file = "temp.wsdl"
-
-        # Descargar el archivo WSDL
-        wsdl_path = descargar_wsdl(url_wsdl, temp_file)
-
-        # Analizar y mostrar la estructura general
-        try:
-            tree = ET.parse(wsdl_path)
-            root = tree.getroot()
-            print("Estructura general del WSDL:")
-            mostrar_estructura_niveles(root)
-        except ET.ParseError:
-            print("Error al analizar el archivo. Asegúrate de que sea un archivo WSDL válido.")
-        finally:
-            # Eliminar archivo temporal
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+        mostrar_jerarquia(sys.argv[1])
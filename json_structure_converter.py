@@ -1,20 +1,21 @@
 import os
-import json
 import sys
+from utilidades_wsdl import cargar_json, guardar_json, nombre_salida_json
 
-def reorganizar_json(ruta_json):
+def reorganizar_json(ruta_json, comprimir=None):
     """
     Reorganiza un archivo JSON en una estructura específica y lo guarda en una nueva carpeta.
 
     Argumentos:
-        ruta_json (str): Ruta al archivo JSON original.
+        ruta_json (str): Ruta al archivo JSON original (.json o .json.gz).
+        comprimir (bool): Si es True se genera un .json.gz; por defecto se
+            conserva el formato del archivo original.
 
     Retorno:
         str: Ruta absoluta del archivo JSON generado.
     """
     # Leer el archivo JSON original
-    with open(ruta_json, "r", encoding="utf-8") as archivo:
-        datos_originales = json.load(archivo)
+    datos_originales = cargar_json(ruta_json)
 
     # Crear la estructura requerida
     estructura = {
@@ -33,12 +34,13 @@ def reorganizar_json(ruta_json):
 
     # Generar el nombre del nuevo archivo
     nombre_original = os.path.basename(ruta_json)
-    nuevo_nombre = f"modelo-datos-{nombre_original}"
+    if comprimir is None:
+        comprimir = nombre_original.endswith(".gz")
+    nuevo_nombre = nombre_salida_json(f"modelo-datos-{nombre_original}", comprimir)
     ruta_salida = os.path.join(carpeta_salida, nuevo_nombre)
 
     # Guardar el nuevo archivo JSON
-    with open(ruta_salida, "w", encoding="utf-8") as archivo_salida:
-        json.dump(estructura, archivo_salida, indent=4, ensure_ascii=False)
+    guardar_json(estructura, ruta_salida)
 
     # Imprimir y retornar la ruta absoluta del archivo generado
     ruta_absoluta = os.path.abspath(ruta_salida)
@@ -47,7 +49,7 @@ def reorganizar_json(ruta_json):
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Uso: python script.py <ruta_json>")
+        print("Uso: python script.py <ruta_json> [--comprimir]")
         sys.exit(1)
 
     # Obtener la ruta del JSON desde los argumentos
@@ -56,4 +58,4 @@ if __name__ == "__main__":
     if not os.path.exists(ruta_json):
         print("El archivo JSON especificado no existe.")
     else:
-        reorganizar_json(ruta_json)
+        reorganizar_json(ruta_json, True if "--comprimir" in sys.argv[2:] else None)
@@ -1,67 +1,218 @@
+import argparse
+import importlib.util
 import os
-import subprocess
 import sys
 
-def ejecutar_n2_wsdl(url_wsdl):
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+SUBCOMANDOS = ("extract", "analyze", "tree", "reorganize", "batch")
+MODULOS_PESADOS = ("requests", "lxml")
+REPETICIONES_ARRANQUE = 3
+SCRIPTS_POR_SUBCOMANDO = {
+    "extract": ("N2-WSDL.py",),
+    "analyze": ("analisis_wsdl.py",),
+    "tree": ("jeraquias_wsdl.py",),
+    "reorganize": ("json_structure_converter.py",),
+    "batch": ("N2-WSDL.py", "json_structure_converter.py")
+}
+
+def cargar_script(nombre_archivo):
     """
-    Ejecuta el script N2-WSDL para generar el primer archivo JSON.
+    Importa bajo demanda uno de los scripts del proyecto.
+
+    Los scripts (y sus dependencias pesadas) solo se cargan cuando el
+    subcomando elegido los necesita; así el arranque de la CLI se mantiene
+    mínimo. Se usa la ruta del archivo porque algunos nombres (N2-WSDL.py)
+    no son identificadores válidos de Python.
 
     Argumentos:
-        url_wsdl (str): URL del archivo WSDL.
+        nombre_archivo (str): Nombre del script, p. ej. "N2-WSDL.py".
 
     Retorno:
-        str: Ruta del archivo JSON generado por N2-WSDL.
+        module: Módulo cargado.
     """
-    print("Ejecutando N2-WSDL...")
-    resultado = subprocess.run(
-        [sys.executable, "N2-WSDL.py", url_wsdl], capture_output=True, text=True
-    )
+    nombre_modulo = os.path.splitext(nombre_archivo)[0].replace("-", "_").lower()
+    if nombre_modulo in sys.modules:
+        return sys.modules[nombre_modulo]
+    if DIRECTORIO not in sys.path:
+        sys.path.insert(0, DIRECTORIO)
+    spec = importlib.util.spec_from_file_location(nombre_modulo, os.path.join(DIRECTORIO, nombre_archivo))
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre_modulo] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
 
-    if resultado.returncode != 0:
-        print("Error ejecutando N2-WSDL:")
-        print(resultado.stderr)
-        sys.exit(1)
+def ejecutar_n2_wsdl(url_wsdl, comprimir=False, indice_campos=False):
+    """
+    Ejecuta N2-WSDL para generar el primer archivo JSON.
+
+    Argumentos:
+        url_wsdl (str): URL o ruta local del archivo WSDL.
+        comprimir (bool): Si es True se genera un .json.gz.
+        indice_campos (bool): Si es True se agrega el índice plano de campos.
 
-    # Extraer la última línea de la salida que contiene la ruta
-    ruta_json = resultado.stdout.strip().splitlines()[-1]
+    Retorno:
+        str: Ruta del archivo JSON generado por N2-WSDL.
+    """
+    print("Ejecutando N2-WSDL...")
+    ruta_json = cargar_script("N2-WSDL.py").extraer_servicio(url_wsdl, comprimir=comprimir, indice_campos=indice_campos)
     print(f"Archivo JSON generado por N2-WSDL: {ruta_json}")
     return ruta_json
 
-def ejecutar_reorganizador(ruta_json):
+def ejecutar_reorganizador(ruta_json, comprimir=None):
     """
-    Ejecuta el script de reorganización para procesar el archivo JSON generado por N2-WSDL.
+    Ejecuta el reorganizador sobre el archivo JSON generado por N2-WSDL.
 
     Argumentos:
         ruta_json (str): Ruta del archivo JSON generado por N2-WSDL.
+        comprimir (bool): Si es True se genera un .json.gz; por defecto se
+            conserva el formato de entrada.
 
     Retorno:
         str: Ruta del archivo JSON reorganizado.
     """
     print("Ejecutando el reorganizador de JSON...")
-    resultado = subprocess.run(
-        [sys.executable, "json_structure_converter.py", ruta_json], capture_output=True, text=True
-    )
-
-    if resultado.returncode != 0:
-        print("Error ejecutando el reorganizador de JSON:")
-        print(resultado.stderr)
-        sys.exit(1)
-
-    # Extraer la última línea de la salida que contiene la ruta
-    ruta_reorganizada = resultado.stdout.strip().splitlines()[-1]
+    ruta_reorganizada = cargar_script("json_structure_converter.py").reorganizar_json(ruta_json, comprimir)
     print(f"Archivo JSON reorganizado: {ruta_reorganizada}")
     return ruta_reorganizada
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Uso: python main.py <url_wsdl>")
+def comando_extract(args):
+    print(cargar_script("N2-WSDL.py").extraer_servicio(args.origen, args.salida, args.comprimir, args.indice_campos))
+
+def comando_analyze(args):
+    cargar_script("analisis_wsdl.py").analizar(args.origen, args.opcion)
+
+def comando_tree(args):
+    cargar_script("jeraquias_wsdl.py").mostrar_jerarquia(args.origen)
+
+def comando_reorganize(args):
+    if not os.path.exists(args.ruta_json):
+        print("El archivo JSON especificado no existe.")
         sys.exit(1)
+    cargar_script("json_structure_converter.py").reorganizar_json(args.ruta_json, args.comprimir or None)
 
-    url_wsdl = sys.argv[1]
+def comando_batch(args):
+    origenes = list(args.origenes)
+    if args.lista:
+        with open(args.lista, "r", encoding="utf-8") as archivo:
+            origenes.extend(linea.strip() for linea in archivo if linea.strip() and not linea.startswith("#"))
+    if not origenes:
+        print("No se indicó ningún WSDL a procesar.")
+        sys.exit(1)
 
-    # Ejecutar el flujo de scripts
-    ruta_json_n2_wsdl = ejecutar_n2_wsdl(url_wsdl)
-    ruta_json_reorganizado = ejecutar_reorganizador(ruta_json_n2_wsdl)
+    for origen in origenes:
+        ruta_json = ejecutar_n2_wsdl(origen, args.comprimir, args.indice_campos)
+        ruta_reorganizada = ejecutar_reorganizador(ruta_json)
+        print(f"Archivo final generado: {ruta_reorganizada}")
 
     print("\nFlujo completado con éxito.")
-    print(f"Archivo final generado: {ruta_json_reorganizado}")
+
+def verificar_tiempo_arranque(presupuesto_ms):
+    """
+    Mide, en un intérprete nuevo por cada subcomando, lo que cuesta importar
+    la CLI junto con los scripts que ese subcomando carga, y lo compara con el
+    presupuesto indicado. También falla si alguna dependencia pesada
+    (requests, lxml) se carga solo por importarlos: deben importarse cuando
+    de verdad se descarga una URL o se valida un WSDL.
+
+    Argumentos:
+        presupuesto_ms (float): Tiempo máximo de importación permitido por subcomando, en milisegundos.
+
+    Retorno:
+        bool: True si todos los subcomandos están dentro del presupuesto.
+    """
+    import subprocess
+
+    medicion = (
+        "import sys, time\n"
+        "inicio = time.perf_counter()\n"
+        "import main\n"
+        "for script in sys.argv[1:]:\n"
+        "    main.cargar_script(script)\n"
+        "print((time.perf_counter() - inicio) * 1000)\n"
+        f"print(','.join(m for m in {MODULOS_PESADOS!r} if m in sys.modules))\n"
+    )
+    correcto = True
+    for comando, scripts in SCRIPTS_POR_SUBCOMANDO.items():
+        # Se toma la menor de varias mediciones para descontar el ruido del sistema
+        tiempos = []
+        for _ in range(REPETICIONES_ARRANQUE):
+            resultado = subprocess.run(
+                [sys.executable, "-c", medicion, *scripts],
+                capture_output=True, text=True, cwd=DIRECTORIO
+            )
+            if resultado.returncode != 0:
+                break
+            lineas = resultado.stdout.splitlines()
+            tiempos.append(float(lineas[-2]))
+            pesados = lineas[-1]
+        if resultado.returncode != 0:
+            print(f"No se pudo medir el arranque de '{comando}':")
+            print(resultado.stderr)
+            correcto = False
+            continue
+
+        tiempo_ms = min(tiempos)
+        print(f"{comando}: {tiempo_ms:.1f} ms (presupuesto: {presupuesto_ms:.1f} ms)")
+        if pesados:
+            print(f"  Dependencias pesadas cargadas al importar: {pesados}")
+        correcto = correcto and tiempo_ms <= presupuesto_ms and not pesados
+    return correcto
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="DocExtractor: extracción, análisis y organización de datos desde archivos WSDL."
+    )
+    parser.add_argument(
+        "--presupuesto-arranque", type=float, nargs="?", const=100.0, metavar="MS",
+        help="Verifica que cada subcomando importe en menos de MS milisegundos (por defecto 100) sin cargar requests ni lxml, y termina."
+    )
+    subparsers = parser.add_subparsers(dest="comando")
+
+    extract = subparsers.add_parser("extract", help="Extrae el modelo N1-WSDL de un WSDL a JSON.")
+    extract.add_argument("origen", help="URL o ruta local del WSDL (acepta .wsdl.gz).")
+    extract.add_argument("--salida", default="N1-WSDL", help="Carpeta de salida (por defecto N1-WSDL).")
+    extract.add_argument("--comprimir", action="store_true", help="Genera la salida como .json.gz.")
+    extract.add_argument("--indice-campos", action="store_true", help="Agrega el índice plano de rutas de campos por mensaje.")
+    extract.set_defaults(funcion=comando_extract)
+
+    analyze = subparsers.add_parser("analyze", help="Análisis exploratorio de un WSDL.")
+    analyze.add_argument("origen", help="URL o ruta local del WSDL.")
+    analyze.add_argument("--opcion", type=int, help="Análisis a ejecutar (si se omite se muestra el menú).")
+    analyze.set_defaults(funcion=comando_analyze)
+
+    tree = subparsers.add_parser("tree", help="Muestra la jerarquía de nodos de un WSDL.")
+    tree.add_argument("origen", help="URL o ruta local del WSDL.")
+    tree.set_defaults(funcion=comando_tree)
+
+    reorganize = subparsers.add_parser("reorganize", help="Reorganiza un JSON N1-WSDL en control/metadatos/datos.")
+    reorganize.add_argument("ruta_json", help="Ruta del JSON generado por extract.")
+    reorganize.add_argument("--comprimir", action="store_true", help="Genera la salida como .json.gz.")
+    reorganize.set_defaults(funcion=comando_reorganize)
+
+    batch = subparsers.add_parser("batch", help="Ejecuta extract + reorganize sobre uno o varios WSDL.")
+    batch.add_argument("origenes", nargs="*", help="URLs o rutas locales de los WSDL.")
+    batch.add_argument("--lista", help="Archivo con un WSDL por línea.")
+    batch.add_argument("--comprimir", action="store_true", help="Genera las salidas como .json.gz.")
+    batch.add_argument("--indice-campos", action="store_true", help="Agrega el índice plano de rutas de campos por mensaje.")
+    batch.set_defaults(funcion=comando_batch)
+
+    return parser
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+
+    # Compatibilidad: `python main.py <url_wsdl>` ejecuta el flujo completo
+    if argumentos and argumentos[0] not in SUBCOMANDOS and not argumentos[0].startswith("-"):
+        argumentos = ["batch"] + argumentos
+
+    parser = crear_parser()
+    args = parser.parse_args(argumentos)
+
+    if args.presupuesto_arranque is not None:
+        sys.exit(0 if verificar_tiempo_arranque(args.presupuesto_arranque) else 1)
+    if args.comando is None:
+        parser.print_help()
+        sys.exit(1)
+
+    args.funcion(args)
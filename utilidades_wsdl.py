@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+import zlib
+
+GZIP_MAGIC = b"\x1f\x8b"
+ACEPTAR_COMPRESION = {"Accept-Encoding": "gzip, deflate"}
+
+def es_url(origen):
+    """
+    Indica si el origen es una URL HTTP(S) o una ruta local.
+    """
+    return origen.startswith("http://") or origen.startswith("https://")
+
+def nombre_local(qname):
+    """
+    Quita el prefijo de un nombre calificado (tns:Nombre -> Nombre).
+    """
+    return qname.strip().split(":")[-1] if qname else None
+
+def es_gzip(ruta):
+    """
+    Indica si un archivo local está comprimido con gzip (por su firma, no por su extensión).
+    """
+    with open(ruta, "rb") as file:
+        return file.read(2) == GZIP_MAGIC
+
+def descargar_archivo(url, archivo_destino, mostrar=False):
+    """
+    Descarga un archivo desde una URL y lo guarda localmente (ya descomprimido).
+    """
+    with open(archivo_destino, "wb") as file:
+        for bloque in leer_bloques(url):
+            file.write(bloque)
+    if mostrar:
+        print(f"Archivo WSDL descargado: {archivo_destino}")
+    return archivo_destino
+
+def _leer_bloques_crudos(origen, tamano_bloque):
+    """
+    Genera los bytes de un archivo local o de una URL tal como llegan.
+
+    requests se importa aquí y no al cargar el módulo, para que los comandos
+    que trabajan con archivos locales no paguen su tiempo de importación. Se
+    negocia gzip/deflate con el servidor; iter_content decodifica el
+    Content-Encoding bloque a bloque.
+    """
+    if not es_url(origen):
+        try:
+            with open(origen, "rb") as file:
+                while True:
+                    bloque = file.read(tamano_bloque)
+                    if not bloque:
+                        return
+                    yield bloque
+        except FileNotFoundError:
+            print(f"Error: No se encontró el archivo en la ruta especificada: {origen}")
+            sys.exit(1)
+        except OSError as e:
+            print(f"Error al leer el archivo: {e}")
+            sys.exit(1)
+
+    import requests
+
+    try:
+        with requests.get(origen, stream=True, headers=ACEPTAR_COMPRESION) as response:
+            response.raise_for_status()
+            for bloque in response.iter_content(chunk_size=tamano_bloque):
+                if bloque:
+                    yield bloque
+    except requests.exceptions.RequestException as e:
+        print(f"Error al descargar el archivo: {e}")
+        sys.exit(1)
+
+def leer_bloques(origen, tamano_bloque=65536):
+    """
+    Genera el contenido de una URL o archivo local en bloques de bytes, a
+    medida que llega, para poder analizarlo mientras se descarga.
+
+    Si el contenido en sí es gzip (p. ej. un .wsdl.gz o .xsd.gz) se
+    descomprime sobre la marcha.
+    """
+    descompresor = None
+    inicio = b""
+    for bloque in _leer_bloques_crudos(origen, tamano_bloque):
+        if inicio is not None:
+            inicio += bloque
+            if len(inicio) < len(GZIP_MAGIC):
+                continue
+            if inicio.startswith(GZIP_MAGIC):
+                descompresor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            bloque, inicio = inicio, None
+        if descompresor is not None:
+            bloque = descompresor.decompress(bloque)
+        if bloque:
+            yield bloque
+
+    if inicio:
+        yield inicio
+    if descompresor is not None:
+        resto = descompresor.flush()
+        if resto:
+            yield resto
+
+def resolver_ubicacion(base, ubicacion):
+    """
+    Resuelve un schemaLocation relativo respecto a la URL o ruta del WSDL.
+    """
+    if es_url(ubicacion) or os.path.isabs(ubicacion):
+        return ubicacion
+    if es_url(base):
+        from urllib.parse import urljoin
+        return urljoin(base, ubicacion)
+    return os.path.join(os.path.dirname(os.path.abspath(base)), ubicacion)
+
+def obtener_archivo(origen, archivo_destino, mostrar=False):
+    """
+    Devuelve una ruta local (sin comprimir) para el origen, descargándolo si
+    es una URL o descomprimiéndolo si es un archivo gzip local.
+
+    Retorno:
+        tuple: (ruta local, True si se creó un archivo temporal que hay que borrar).
+    """
+    if es_url(origen):
+        return descargar_archivo(origen, archivo_destino, mostrar), True
+    if not os.path.exists(origen):
+        print(f"Error: No se encontró el archivo en la ruta especificada: {origen}")
+        sys.exit(1)
+    if es_gzip(origen):
+        with open(archivo_destino, "wb") as file:
+            for bloque in leer_bloques(origen):
+                file.write(bloque)
+        return archivo_destino, True
+    return origen, False
+
+def nombre_salida_json(nombre, comprimir):
+    """
+    Ajusta la extensión de un archivo de salida a .json o .json.gz.
+    """
+    if nombre.endswith(".gz"):
+        nombre = nombre[:-3]
+    return f"{nombre}.gz" if comprimir else nombre
+
+def guardar_json(data, ruta):
+    """
+    Guarda datos como JSON; si la ruta termina en .gz se escribe comprimido.
+    """
+    if ruta.endswith(".gz"):
+        import gzip
+        archivo = gzip.open(ruta, "wt", encoding="utf-8")
+    else:
+        archivo = open(ruta, "w", encoding="utf-8")
+    with archivo:
+        json.dump(data, archivo, indent=4, ensure_ascii=False)
+    return ruta
+
+def cargar_json(ruta):
+    """
+    Carga un archivo JSON, esté o no comprimido con gzip.
+    """
+    if es_gzip(ruta):
+        import gzip
+        archivo = gzip.open(ruta, "rt", encoding="utf-8")
+    else:
+        archivo = open(ruta, "r", encoding="utf-8")
+    with archivo:
+        return json.load(archivo)
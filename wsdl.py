@@ -1,22 +1,7 @@
 import xml.etree.ElementTree as ET
 import sys
-import requests
 import os
-
-def descargar_wsdl(url, archivo_destino):
-    """
-    Descarga el archivo WSDL desde una URL y lo guarda localmente.
-    """
-    try:
-        response = requests.get(url)
-        response.raise_for_status()  # Verifica si hubo errores en la solicitud
-        with open(archivo_destino, "wb") as file:
-            file.write(response.content)
-        print(f"Archivo WSDL descargado: {archivo_destino}")
-        return archivo_destino
-    except requests.exceptions.RequestException as e:
-        print(f"Error al descargar el archivo WSDL: {e}")
-        sys.exit(1)
+from utilidades_wsdl import obtener_archivo
 
 def analizar_wsdl(file_path):
     """
@@ -64,20 +49,16 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Uso: python script.py <ruta_al_archivo_wsdl_o_url>")
     else:
-        wsdl_path = sys.argv[1]
-
-        # Verificar si es una URL
-        if wsdl_path.startswith("http://") or wsdl_path.startswith("https://"):
-            # Descargar el archivo WSDL y analizarlo
-            local_file = "temp.wsdl"  # Archivo temporal para guardar el WSDL
-            wsdl_path = descargar_wsdl(wsdl_path, local_file)
+        # Descargar (si es URL) o descomprimir (si es .wsdl.gz) a un archivo temporal
+        local_file = "temp.wsdl"  # Archivo temporal para guardar el WSDL
+        wsdl_path, es_temporal = obtener_archivo(sys.argv[1], local_file, mostrar=True)
 
         # Analizar el archivo WSDL
         analizar_wsdl(wsdl_path)
 
-        # Limpiar el archivo temporal si se descargó
-        if os.path.exists("temp.wsdl"):
-            os.remove("temp.wsdl")
+        # Limpiar el archivo temporal si se creó
+        if es_temporal:
+            os.remove(wsdl_path)
 
 '''
 1. Recibe una URL o archivo local como entrada: